@@ -63,19 +63,6 @@ class RecipeFilter(filters.FilterSet):
             return recipes.filter(carts__user=self.request.user)
         return recipes
 
-    def filter_queryset(self, recipes):
-        """
-        Добавляет оптимизацию к запросу: выбирает связанные поля автора и
-        тегов.
-        Вызывается перед основной фильтрацией.
-
-        :param recipes: QuerySet рецептов.
-        :return: Оптимизированный QuerySet.
-        """
-        recipes = recipes.select_related('author')
-        recipes = recipes.prefetch_related('tags')
-        return super().filter_queryset(recipes)
-
 
 class IngredientSearchFilter(filters.FilterSet):
     """
@@ -143,14 +143,24 @@ class RecipeReadSerializer(serializers.ModelSerializer):
         ).exists()
 
     def get_is_favorited(self, recipe):
-        """Проверяет, добавлен ли рецепт в избранное."""
+        """
+        Проверяет, добавлен ли рецепт в избранное.
+        Использует аннотацию из RecipeViewSet, если она есть.
+        """
+        if hasattr(recipe, 'is_favorited'):
+            return recipe.is_favorited
         return self.check_user_status_and_recipe_exists(
             Favorite,
             recipe
         )
 
     def get_is_in_shopping_cart(self, recipe):
-        """Проверяет, добавлен ли рецепт в список покупок."""
+        """
+        Проверяет, добавлен ли рецепт в список покупок.
+        Использует аннотацию из RecipeViewSet, если она есть.
+        """
+        if hasattr(recipe, 'is_in_shopping_cart'):
+            return recipe.is_in_shopping_cart
         return self.check_user_status_and_recipe_exists(
             ShoppingCart,
             recipe
@@ -340,10 +350,8 @@ class UserFollowSerializer(UserSerializer):
     """Сериализатор подписки. Добавляет краткие рецепты и их количество."""
 
     recipes = serializers.SerializerMethodField()
-    recipes_count = serializers.IntegerField(
-        source='recipes.count',
-        read_only=True
-    )
+    # Значение аннотируется в запросе, см. FoodgramUserViewSet
+    recipes_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = User
@@ -6,7 +6,8 @@
 """
 
 from django.contrib.auth import get_user_model
-from django.db.models import Prefetch, Sum
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Sum
 from django.http import FileResponse
 from django.shortcuts import get_object_or_404
 from django.template.loader import render_to_string
@@ -32,6 +33,11 @@ from recipes.models import (Favorite, Follow, Ingredient, IngredientRecipe,
 
 User = get_user_model()
 
+# Поля пользователя, которые выводятся в списках
+USER_LIST_FIELDS = (
+    'id', 'email', 'username', 'first_name', 'last_name', 'avatar'
+)
+
 
 class FoodgramUserViewSet(UserViewSet):
     """
@@ -44,6 +50,16 @@ class FoodgramUserViewSet(UserViewSet):
     serializer_class = FoodgramUserSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
+    def get_queryset(self):
+        """
+        Для списка пользователей загружает только выводимые поля:
+        хеш пароля и служебные поля в ответ не попадают.
+        """
+        users = super().get_queryset()
+        if self.action == 'list':
+            return users.only(*USER_LIST_FIELDS)
+        return users
+
     @action(['get'],
             detail=False,
             permission_classes=[IsAuthenticated])
@@ -83,10 +99,14 @@ class FoodgramUserViewSet(UserViewSet):
                 {'avatar': user.avatar.url if user.avatar else None},
                 status=status.HTTP_200_OK)
         # для метода 'DELETE'
-        if user.avatar:
-            user.avatar.delete(save=False)
+        avatar_name = user.avatar.name
         user.avatar = None
-        user.save()
+        user.save(update_fields=['avatar'])
+        if avatar_name:
+            # Файл удаляется только после фиксации транзакции: при откате
+            # запись в базе не останется ссылкой на удалённый файл
+            storage = user.avatar.storage
+            transaction.on_commit(lambda: storage.delete(avatar_name))
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @action(detail=True,
@@ -110,7 +130,10 @@ class FoodgramUserViewSet(UserViewSet):
             return Response(status=status.HTTP_204_NO_CONTENT)
 
         # для метода 'POST':
-        author = get_object_or_404(User, pk=pk)
+        author = get_object_or_404(
+            User.objects.annotate(recipes_count=Count('recipes')),
+            pk=pk
+        )
 
         if user == author:
             raise ValidationError('Нельзя подписаться на самого себя')
@@ -143,7 +166,7 @@ class FoodgramUserViewSet(UserViewSet):
             pk__in=Follow.objects
             .filter(user=request.user)
             .values_list('following__id', flat=True)
-        )
+        ).only(*USER_LIST_FIELDS).annotate(recipes_count=Count('recipes'))
         paginated_qs = self.paginate_queryset(authors)
         serializer = UserFollowSerializer(
             paginated_qs, many=True, context={'request': request}
@@ -206,11 +229,18 @@ class RecipeViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Возвращает оптимизированный QuerySet рецептов."""
-        return Recipe.objects.prefetch_related(
-            Prefetch('tags', queryset=Tag.objects.all()),
-            Prefetch('author'),
-            Prefetch('ingredients', queryset=Ingredient.objects.all())
-        )
+        recipes = Recipe.objects.with_related()
+        user = self.request.user
+        if user.is_authenticated:
+            recipes = recipes.annotate(
+                is_favorited=Exists(Favorite.objects.filter(
+                    user=user, recipe=OuterRef('pk')
+                )),
+                is_in_shopping_cart=Exists(ShoppingCart.objects.filter(
+                    user=user, recipe=OuterRef('pk')
+                )),
+            )
+        return recipes
 
     def get_serializer_context(self):
         """Добавляет контекст запроса в сериализатор."""
@@ -296,7 +326,7 @@ class RecipeViewSet(viewsets.ModelViewSet):
         user = request.user
         recipes = Recipe.objects.filter(
             carts__user=user
-        )
+        ).select_related('author')
 
         ingredients = IngredientRecipe.objects.filter(
             recipe__in=recipes
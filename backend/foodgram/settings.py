@@ -145,6 +145,9 @@ STATIC_ROOT = BASE_DIR / 'collected_static'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Каталог с JSON-файлами для команды load_data
+DATA_DIR = Path(os.getenv('DATA_DIR', BASE_DIR.parent / 'data'))
+
 # Default primary key field type
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -1,8 +1,10 @@
 from django import forms
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.password_validation import validate_password
-from django.db.models import Count
+from django.db.models import Count, Value
+from django.db.models.functions import Concat
 from django.utils.safestring import mark_safe
 
 from recipes.filters import (CookingTimeFilter, HasFollowersFilter,
@@ -62,6 +64,22 @@ class FoodgramUserChangeForm(forms.ModelForm):
         return user
 
 
+class FoodgramUserChangeList(ChangeList):
+    """Список пользователей без загрузки неотображаемых полей."""
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).only(
+            'id',
+            'username',
+            'first_name',
+            'last_name',
+            'email',
+            'avatar',
+            'last_login',
+            'is_active',
+        )
+
+
 @admin.register(FoodgramUser)
 class FoodgramUserAdmin(BaseUserAdmin):
     form = FoodgramUserChangeForm
@@ -139,10 +157,10 @@ class FoodgramUserAdmin(BaseUserAdmin):
         ),
     )
 
-    @admin.display(description='Имя фамилия')
+    @admin.display(description='Имя фамилия', ordering='full_name')
     def full_name(self, user):
         """Получение полного имени"""
-        return user.get_full_name()
+        return user.full_name
 
     @admin.display(description='Рецептов')
     def recipe_count(self, user):
@@ -166,12 +184,17 @@ class FoodgramUserAdmin(BaseUserAdmin):
 
     def get_queryset(self, request):
         queryset = super().get_queryset(request)
-        return queryset.prefetch_related(
+        return queryset.annotate(
+            full_name=Concat('first_name', Value(' '), 'last_name')
+        ).prefetch_related(
             'recipes',
             'favorites',
             'followers'
         )
 
+    def get_changelist(self, request, **kwargs):
+        return FoodgramUserChangeList
+
 
 @admin.register(Tag)
 class TagAdmin(admin.ModelAdmin):
@@ -257,16 +280,14 @@ class RecipeAdmin(admin.ModelAdmin):
     )
 
     def get_queryset(self, request):
-        queryset = super().get_queryset(request)
+        queryset = super().get_queryset(request).with_related()
         return queryset.annotate(
             favorites_count=Count('favorites')
         )
 
-    @mark_safe
-    @admin.display(description='В избранном')
+    @admin.display(description='В избранном', ordering='favorites_count')
     def favorites_count(self, recipe):
-        count = recipe.favorites_count
-        return count
+        return recipe.favorites_count
 
     @admin.display(description='Изображение')
     def recipe_image(self, recipe):
@@ -288,14 +309,6 @@ class RecipeAdmin(admin.ModelAdmin):
     def tags_list(self, recipe):
         return mark_safe('<br>'.join(tag.name for tag in recipe.tags.all()))
 
-    @admin.display(description='Время (мин.)')
-    def cooking_time_display(self, recipe):
-        return f'{recipe.cooking_time} мин'
-
-    @admin.display(description='Автор')
-    def author_display(self, recipe):
-        return recipe.author.username
-
 
 @admin.register(Follow)
 class FollowAdmin(admin.ModelAdmin):
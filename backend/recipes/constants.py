@@ -15,3 +15,6 @@ SLUG_MAX_LENGTH = 32
 INGREDIENT_MAX_LENGTH = 128
 UNIT_OF_MEASURE_MAX_LENGTH = 64
 MIN_INGREDIENT_AMOUNT = 1
+
+SHORT_LINK_CACHE_KEY = 'short-link:{}'  # подставляется id рецепта
+SHORT_LINK_CACHE_TIMEOUT = 60 * 60  # в секундах
@@ -1,6 +1,5 @@
 from django.contrib.admin import SimpleListFilter
-
-from recipes.models import Recipe
+from django.db.models import Count, Q
 
 
 class BaseHasFilter(SimpleListFilter):
@@ -50,20 +49,21 @@ class CookingTimeFilter(SimpleListFilter):
 
     def _range_filter(self, selected, recipes=None):
         bounds = self.thresholds[selected]['range']
-        return (
-            recipes
-            or self.recipes
-            or Recipe.objects.all()
-        ).filter(cooking_time__range=bounds)
+        if recipes is None:
+            recipes = self.recipes
+        return recipes.filter(cooking_time__range=bounds)
 
     def lookups(self, request, model_admin):
         self.recipes = model_admin.get_queryset(request)
-        times = list(self.recipes.values_list('cooking_time', flat=True))
+        times = list(
+            self.recipes
+            .order_by('cooking_time')
+            .values_list('cooking_time', flat=True)
+        )
 
         if len(set(times)) < 3:
             return []
 
-        times.sort()
         short_time_max = times[len(times) // 3]
         medium_time_max = times[2 * len(times) // 3]
 
@@ -81,13 +81,14 @@ class CookingTimeFilter(SimpleListFilter):
                 'label': 'долгие',
             },
         }
+        # Все счётчики одним запросом вместо COUNT на каждый диапазон
+        counts = self.recipes.order_by().aggregate(**{
+            key: Count('id', filter=Q(cooking_time__range=value['range']))
+            for key, value in self.thresholds.items()
+        })
 
         return [
-            (
-                key,
-                f"{value['label']} "
-                f"({self._range_filter(key).count()})"
-            )
+            (key, f"{value['label']} ({counts[key]})")
             for key, value in self.thresholds.items()
         ]
 
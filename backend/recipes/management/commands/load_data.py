@@ -7,12 +7,26 @@ python manage.py load_data --data_type=tags
 # Для загрузки ингредиентов
 python manage.py load_data --data_type=ingredients
 """
-import json
-from pathlib import Path
+import csv
+import io
+from itertools import islice
 
+import ijson
 from django.apps import apps
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+# Количество объектов, передаваемых в одну вставку
+BATCH_SIZE = 1000
+
+
+def loaded_fields(model):
+    """Возвращает поля модели, значения которых берутся из файла."""
+    return [
+        field for field in model._meta.concrete_fields
+        if not field.primary_key
+    ]
 
 
 class Command(BaseCommand):
@@ -40,26 +54,120 @@ class Command(BaseCommand):
     def handle(self, *args, **kwargs):
         data_type = kwargs['data_type']
 
-        # Определяем путь к файлу
-        file_path = Path(
-            settings.BASE_DIR
-        ).parent / 'data' / f'{data_type}.json'
+        file_path = settings.DATA_DIR / f'{data_type}.json'
+
+        model = self.MODELS_MAP.get(data_type)
 
         try:
-            with open(file_path, encoding='utf-8') as file:
-                created = self.MODELS_MAP.get(data_type).objects.bulk_create(
-                    (self.MODELS_MAP.get(data_type)(**item)
-                     for item in json.load(file)),
-                    ignore_conflicts=True
-                )
+            # Без буферизации: ijson сам читает файл блоками, и лишнее
+            # копирование через буфер BufferedReader не нужно
+            with open(file_path, 'rb', buffering=0) as file, \
+                    transaction.atomic():
+                # Файл разбирается потоково: в памяти одновременно находится
+                # не больше одной пачки записей
+                items = self.clean_items(model, ijson.items(file, 'item'))
+                if connection.vendor == 'postgresql':
+                    created = self.copy_items(model, items)
+                else:
+                    created = self.bulk_create_items(model, items)
+                self.analyze(model)
                 self.stdout.write(
                     self.style.SUCCESS(
-                        f'Добавлено {len(created)} объектов из '
+                        f'Добавлено {created} объектов из '
                         f'файла "{file_path}"'
                     )
                 )
+                if self.skipped:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f'Пропущено {self.skipped} неполных или '
+                            'повторяющихся записей'
+                        )
+                    )
 
         except Exception as e:
             self.stderr.write(
                 self.style.ERROR(f'Произошла ошибка: {e}, в файле {file_path}')
             )
+
+    def clean_items(self, model, items):
+        """
+        Проверяет записи прямо во время разбора файла.
+
+        Пропускает записи с незаполненными полями и повторы, лишние ключи
+        отбрасывает. Количество пропущенных записей сохраняется в
+        self.skipped. Записи, которые уже есть в таблице, не передаются в
+        базу вовсе: так повторная загрузка не тратит вставки на конфликты.
+        """
+        names = [field.attname for field in loaded_fields(model)]
+        existing = set(
+            model.objects.order_by().values_list(*names)
+            .iterator(chunk_size=10000)
+        )
+        seen = set()
+        self.skipped = 0
+        for item in items:
+            values = tuple(item.get(name) for name in names)
+            if not all(values) or values in seen:
+                self.skipped += 1
+                continue
+            seen.add(values)
+            if values not in existing:
+                yield dict(zip(names, values))
+
+    def bulk_create_items(self, model, items):
+        """
+        Вставляет записи пачками через bulk_create.
+
+        С ignore_conflicts bulk_create возвращает все переданные объекты,
+        включая пропущенные, поэтому число добавленных считается по таблице.
+        """
+        count_before = model.objects.count()
+        objects = (model(**item) for item in items)
+        while batch := list(islice(objects, BATCH_SIZE)):
+            model.objects.bulk_create(batch, ignore_conflicts=True)
+        return model.objects.count() - count_before
+
+    def copy_items(self, model, items):
+        """
+        Загружает записи в PostgreSQL через COPY.
+
+        Данные копируются во временную таблицу, а затем переносятся в
+        основную одним INSERT ... ON CONFLICT DO NOTHING, чтобы уже
+        существующие записи пропускались, как при ignore_conflicts.
+        """
+        fields = loaded_fields(model)
+        quote_name = connection.ops.quote_name
+        table = quote_name(model._meta.db_table)
+        columns = ', '.join(quote_name(field.column) for field in fields)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'CREATE TEMPORARY TABLE load_data ON COMMIT DROP AS '
+                f'SELECT {columns} FROM {table} WITH NO DATA'
+            )
+            rows = (
+                [item[field.attname] for field in fields] for item in items
+            )
+            while batch := list(islice(rows, BATCH_SIZE)):
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(batch)
+                buffer.seek(0)
+                cursor.copy_expert(
+                    f'COPY load_data ({columns}) FROM STDIN WITH (FORMAT csv)',
+                    buffer
+                )
+            # Сортировка даёт вставку в уникальный индекс по порядку ключей
+            cursor.execute(
+                f'INSERT INTO {table} ({columns}) '
+                f'SELECT {columns} FROM load_data ORDER BY {columns} '
+                'ON CONFLICT DO NOTHING'
+            )
+            return cursor.rowcount
+
+    def analyze(self, model):
+        """Обновляет статистику планировщика после массовой загрузки."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}'
+            )
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.23 on 2026-10-16 19:33
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class PostgresOnlyMixin:
+    """Операция выполняется только в PostgreSQL."""
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+
+class PostgresTrigramExtension(PostgresOnlyMixin, TrigramExtension):
+    pass
+
+
+class PostgresRunSQL(PostgresOnlyMixin, migrations.RunSQL):
+    pass
+
+
+class Migration(migrations.Migration):
+    # Индекс не входит в Meta.indexes модели: иначе в других СУБД он
+    # пересоздавался бы при любой перестройке таблицы продуктов
+
+    dependencies = [
+        ('recipes', '0007_follow_following_user_idx'),
+    ]
+
+    operations = [
+        PostgresTrigramExtension(),
+        PostgresRunSQL(
+            sql='CREATE INDEX ingredient_name_trgm_idx '
+                'ON recipes_ingredient USING gin (UPPER(name) gin_trgm_ops)',
+            reverse_sql='DROP INDEX IF EXISTS ingredient_name_trgm_idx',
+        ),
+    ]
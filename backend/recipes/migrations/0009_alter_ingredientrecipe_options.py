@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-16 19:35
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0008_ingredient_name_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='ingredientrecipe',
+            options={'default_related_name': 'amount_ingredients', 'verbose_name': 'Продукт рецепта', 'verbose_name_plural': 'Продукты рецептов'},
+        ),
+    ]
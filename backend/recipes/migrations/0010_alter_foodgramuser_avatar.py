@@ -0,0 +1,19 @@
+# Generated by Django 4.2.23 on 2026-10-16 19:37
+
+from django.db import migrations, models
+import recipes.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0009_alter_ingredientrecipe_options'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='foodgramuser',
+            name='avatar',
+            field=models.ImageField(blank=True, null=True, upload_to=recipes.models.avatar_upload_to, verbose_name='Аватар'),
+        ),
+    ]
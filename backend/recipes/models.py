@@ -1,4 +1,7 @@
-from django.contrib.auth import get_user_model
+import hashlib
+from pathlib import Path
+
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator, RegexValidator
 from django.db import models
@@ -17,6 +20,18 @@ username_validator = RegexValidator(
 )
 
 
+def avatar_upload_to(user, filename):
+    """
+    Раскладывает аватары по вложенным каталогам по первым символам хеша,
+    чтобы в одном каталоге не скапливались тысячи файлов.
+    """
+    digest = hashlib.blake2b(
+        f'{user.pk}:{filename}'.encode(), digest_size=8
+    ).hexdigest()
+    return (f'users/avatars/{digest[:2]}/{digest[2:4]}/'
+            f'{digest}{Path(filename).suffix}')
+
+
 class FoodgramUser(AbstractUser):
     username = models.CharField(
         'Никнейм',
@@ -32,7 +47,7 @@ class FoodgramUser(AbstractUser):
     )
     avatar = models.ImageField(
         'Аватар',
-        upload_to='users/avatars/',
+        upload_to=avatar_upload_to,
         blank=True,
         null=True,
     )
@@ -106,13 +121,25 @@ class Ingredient(models.Model):
                 name='unique_ingredient_unit'
             )
         ]
+        # Триграммный индекс для поиска по началу названия без учёта
+        # регистра (name__istartswith сравнивает UPPER(name)) есть только
+        # в PostgreSQL и создаётся миграцией 0008 вне состояния модели.
 
     def __str__(self):
         return (f'{self.name[:TEXT_FIELDS_DISPLAY_LENGTH]} '
                 f'({self.measurement_unit})')
 
 
-UserModel = get_user_model()
+class RecipeQuerySet(models.QuerySet):
+    def with_related(self):
+        """Подгружает автора, теги и продукты рецептов заранее."""
+        return self.select_related('author').prefetch_related(
+            'tags',
+            models.Prefetch(
+                'amount_ingredients',
+                queryset=IngredientRecipe.objects.select_related('ingredient')
+            ),
+        )
 
 
 class Recipe(models.Model):
@@ -130,7 +157,7 @@ class Recipe(models.Model):
         'Описание',
     )
     author = models.ForeignKey(
-        UserModel,
+        settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         verbose_name='Автор',
     )
@@ -157,11 +184,17 @@ class Recipe(models.Model):
         auto_now_add=True
     )
 
+    objects = RecipeQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'рецепт'
         verbose_name_plural = 'Рецепты'
         ordering = ('-pub_date',)
         default_related_name = 'recipes'
+        indexes = (
+            models.Index(fields=('-pub_date',), name='recipe_pub_date_idx'),
+            models.Index(fields=('name',), name='recipe_name_idx'),
+        )
 
     def __str__(self) -> str:
         return self.name[:TEXT_FIELDS_DISPLAY_LENGTH]
@@ -187,7 +220,6 @@ class IngredientRecipe(models.Model):
     )
 
     class Meta:
-        ordering = ('recipe',)
         verbose_name = 'Продукт рецепта'
         verbose_name_plural = 'Продукты рецептов'
         default_related_name = 'amount_ingredients'
@@ -197,6 +229,14 @@ class IngredientRecipe(models.Model):
                 name='unique_ingredient'
             ),
         )
+        # Уникальный индекс начинается с recipe; для выборок по продукту
+        # нужен индекс с обратным порядком полей
+        indexes = (
+            models.Index(
+                fields=('ingredient', 'recipe'),
+                name='ingredient_recipe_idx'
+            ),
+        )
 
     def __str__(self) -> str:
         return f'{self.amount} {self.ingredient}'
@@ -206,7 +246,7 @@ class BaseUserRecipeModel(models.Model):
     """Базовый класс для моделей, связывающих пользователя с рецептом."""
 
     user = models.ForeignKey(
-        UserModel,
+        settings.AUTH_USER_MODEL,
         verbose_name='Пользователь',
         on_delete=models.CASCADE
     )
@@ -251,13 +291,13 @@ class Favorite(BaseUserRecipeModel):
 
 class Follow(models.Model):
     user = models.ForeignKey(
-        UserModel,
+        settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         verbose_name='Кто подписан',
         related_name='followers',
     )
     following = models.ForeignKey(
-        UserModel,
+        settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         verbose_name='На кого подписан',
         related_name='authors',
@@ -276,6 +316,12 @@ class Follow(models.Model):
                 name='prevent_self_follow'
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=['following', 'user'],
+                name='following_user_idx'
+            ),
+        ]
         ordering = ('user__username', 'following__username')
 
     def __str__(self):
@@ -0,0 +1,12 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from recipes.constants import SHORT_LINK_CACHE_KEY
+from recipes.models import Recipe
+
+
+@receiver(post_delete, sender=Recipe)
+def forget_short_link(sender, instance, **kwargs):
+    """Убирает удалённый рецепт из кеша коротких ссылок."""
+    cache.delete(SHORT_LINK_CACHE_KEY.format(instance.pk))
@@ -1,10 +1,17 @@
+from django.core.cache import cache
 from django.http import Http404
 from django.shortcuts import redirect
 
+from recipes.constants import SHORT_LINK_CACHE_KEY, SHORT_LINK_CACHE_TIMEOUT
 from recipes.models import Recipe
 
 
 def redirect_short_link(request, recipe_id):
-    if not Recipe.objects.filter(id=recipe_id).exists():
-        raise Http404(f'Рецепт {recipe_id} не найден')
+    # Кешируются только существующие рецепты: закешированное отсутствие
+    # рецепта в одном процессе пережило бы его создание в другом
+    key = SHORT_LINK_CACHE_KEY.format(recipe_id)
+    if not cache.get(key):
+        if not Recipe.objects.filter(id=recipe_id).exists():
+            raise Http404(f'Рецепт {recipe_id} не найден')
+        cache.set(key, True, SHORT_LINK_CACHE_TIMEOUT)
     return redirect(f'/recipes/{recipe_id}/')